@@ -1,12 +1,11 @@
 import json
-import re
 import uuid
 import html as py_html
-from typing import List, Dict, Any
 
 import streamlit as st
 from streamlit.components.v1 import html as st_html
-from markdown_it import MarkdownIt
+
+from processing import condense_text, parse_markdown_tables
 
 PROMPT = '''I am about to paste an article from the *Journal of Natural Products*. This article may contain spectral peak data (e.g., NMR, IR, MS, UV).
 
@@ -105,12 +104,24 @@ Here is the article:
 # ---------------------------
 # Version / Git helpers (optional banner info)
 # ---------------------------
+@st.cache_data(show_spinner=False)
 def get_git_short_rev():
     """Return short git hash if .git is present; else a placeholder."""
     try:
-        with open(".git/logs/HEAD", "r") as f:
-            last_line = f.readlines()[-1]
-            hash_val = last_line.split()[1]
+        with open(".git/logs/HEAD", "rb") as f:
+            # Only the last reflog entry is needed, so read just the file's tail
+            size = f.seek(0, 2)
+            start = max(0, size - 4096)
+            f.seek(start)
+            lines = f.read().splitlines()
+            if start:
+                lines = lines[1:]  # first line may be cut off
+            if not lines:
+                # Last entry is longer than the tail; fall back to the whole file
+                f.seek(0)
+                lines = f.read().splitlines()
+            last_line = lines[-1]
+            hash_val = last_line.split()[1].decode()
         return hash_val[:7]
     except Exception:
         return ".git/ not found"
@@ -144,133 +155,6 @@ st.set_page_config(
 st.write("Welcome to the homepage!")
 
 
-# ---------------------------
-# Processing logic
-# ---------------------------
-
-def condense_text(article_text: str) -> str:
-    """
-    Your requested logic:
-
-    - Find the first occurrence of an 'Abstract' heading/line and return the text AFTER it.
-    - Find the 'References' block:
-
-        References
-        This article references <NUMBER> other publications.
-
-      Return the text BEFORE this block.
-    - If BOTH are found and Abstract precedes References, return the intersection:
-        [after Abstract .. before References]
-      Else return whichever slice is found; if neither is found, return the original text.
-    """
-    text = article_text
-
-    # First "Abstract" (accept line 'Abstract' or word followed by newline)
-    abstract_heading_pattern_strict = re.compile(r'(?im)^[ \t]*abstract[ \t]*\r?\n')
-    abstract_heading_pattern_loose = re.compile(r'(?i)\babstract\b[ \t]*\r?\n')
-    abstract_match = abstract_heading_pattern_strict.search(text) or abstract_heading_pattern_loose.search(text)
-    abstract_after_idx = abstract_match.end() if abstract_match else None
-
-    # "References" block
-    references_pattern = re.compile(
-        r'(?is)'                               # case-insensitive, dot matches newlines
-        r'^\s*references\s*\r?\n'              # line with 'References'
-        r'\s*this\s+article\s+references\s+'   # 'This article references'
-        r'(\d+)\s+other\s+publications\.\s*',  # '<NUMBER> other publications.'
-        flags=re.IGNORECASE | re.MULTILINE | re.DOTALL
-    )
-    references_match = references_pattern.search(text)
-    references_start_idx = references_match.start() if references_match else None
-
-    if abstract_after_idx is not None and references_start_idx is not None:
-        if abstract_after_idx < references_start_idx:
-            result = text[abstract_after_idx:references_start_idx]
-        else:
-            # If order is inverted, prefer "after Abstract"
-            result = text[abstract_after_idx:]
-    elif abstract_after_idx is not None:
-        result = text[abstract_after_idx:]
-    elif references_start_idx is not None:
-        result = text[:references_start_idx]
-    else:
-        result = text
-
-    # Tidy leading/trailing whitespace
-    result = re.sub(r'^[ \t]*\r?\n', '', result)
-    result = result.strip('\n\r ')
-    return PROMPT + result
-
-
-def parse_markdown_tables(md_text: str) -> List[Dict[str, Any]]:
-    """
-    Parse all markdown tables and associate each with the nearest preceding heading (H1..H6).
-
-    Returns a list of table dicts:
-      {
-        "title": "<heading text or ''>",
-        "headers": ["Col1", "Col2", ...],
-        "rows": [["r1c1","r1c2",...], ["r2c1","r2c2",...]]
-      }
-    """
-    md = MarkdownIt("commonmark").enable("table")
-    tokens = md.parse(md_text)
-
-    results: List[Dict[str, Any]] = []
-    last_heading_text: str = ""
-
-    i = 0
-    n = len(tokens)
-    while i < n:
-        tok = tokens[i]
-
-        # Track nearest preceding heading
-        if tok.type == "heading_open":
-            if i + 1 < n and tokens[i + 1].type == "inline":
-                last_heading_text = tokens[i + 1].content.strip()
-            i += 1
-
-        # Extract table
-        elif tok.type == "table_open":
-            j = i + 1
-            headers: list[str] = []
-            rows: list[list[str]] = []
-            cur_row: list[str] = []
-            in_header = False
-
-            while j < n:
-                t = tokens[j]
-
-                if t.type == "thead_open":
-                    in_header = True
-                elif t.type == "thead_close":
-                    in_header = False
-
-                elif t.type == "tr_open":
-                    cur_row = []
-                elif t.type == "tr_close":
-                    if in_header:
-                        headers = cur_row
-                    else:
-                        rows.append(cur_row)
-                    cur_row = []
-
-                elif t.type in ("th_open", "td_open"):
-                    if j + 1 < n and tokens[j + 1].type == "inline":
-                        cell_text = tokens[j + 1].content.strip()
-                        cur_row.append(cell_text)
-
-                elif t.type == "table_close":
-                    break
-
-                j += 1
-
-            results.append({"title": last_heading_text, "headers": headers, "rows": rows})
-            i = j
-        i += 1
-
-    return results
-
-
 # ---------------------------
 # Session state init
 # ---------------------------
@@ -286,7 +170,7 @@ if "tables_output" not in st.session_state:
 # ---------------------------
 def handle_process_article():
     text = st.session_state.article_input
-    st.session_state.article_output = condense_text(text) if text.strip() else ""
+    st.session_state.article_output = PROMPT + condense_text(text) if text.strip() else ""
 
 def handle_clear_article():
     st.session_state.article_input = ""
@@ -356,67 +240,79 @@ def copybox(label: str, value: str, height: int = 140, key: str | None = None):
 # ---------------------------
 # UI — Article
 # ---------------------------
-st.markdown("## Article → Condensed Text")
+# Each section is a fragment: interacting with its widgets reruns only that
+# section, so e.g. processing an article doesn't re-render every parsed table.
+@st.fragment
+def article_section():
+    st.markdown("## Article → Condensed Text")
+
+    st.text_area(
+        "Paste article text",
+        key="article_input",
+        height=220,
+        placeholder="Paste your article here…",
+    )
 
-st.text_area(
-    "Paste article text",
-    key="article_input",
-    height=220,
-    placeholder="Paste your article here…",
-)
+    c1, c2 = st.columns([1, 1])
+    with c1:
+        st.button("Process", use_container_width=True, on_click=handle_process_article)
+    with c2:
+        st.button("Clear", use_container_width=True, on_click=handle_clear_article)
+
+    if st.session_state.article_output:
+        copybox("GPT-Formatted Query", st.session_state.article_output, height=140, key="condensed")
 
-c1, c2 = st.columns([1, 1])
-with c1:
-    st.button("Process", use_container_width=True, on_click=handle_process_article)
-with c2:
-    st.button("Clear", use_container_width=True, on_click=handle_clear_article)
 
-if st.session_state.article_output:
-    copybox("GPT-Formatted Query", st.session_state.article_output, height=140, key="condensed")
+article_section()
 
 st.divider()
 
 # ---------------------------
 # UI — GPT tables
 # ---------------------------
-st.markdown("## GPT Response → Tables (read-only) + JSON")
+@st.fragment
+def tables_section():
+    st.markdown("## GPT Response → Tables (read-only) + JSON")
+
+    st.text_area(
+        "Paste GPT response containing Markdown headings and tables",
+        key="gpt_input",
+        height=260,
+        placeholder="# Title\n\n| Col A | Col B |\n|---|---|\n| foo | bar |",
+    )
+
+    t1, t2 = st.columns([1, 1])
+    with t1:
+        st.button("Parse tables", use_container_width=True, on_click=handle_parse_tables)
+    with t2:
+        st.button("Clear tables", use_container_width=True, on_click=handle_clear_tables)
+
+    tables = st.session_state.tables_output
+    if tables:
+        for idx, t in enumerate(tables, start=1):
+            title = t.get("title") or "(untitled)"
+            st.subheader(f"Table {idx}: {title}")
+
+            headers = t.get("headers") or []
+            rows = t.get("rows") or []
+
+            if headers:
+                # Render as list-of-dicts for nice headers; short rows are padded
+                # with "" and extra cells beyond the headers are dropped by zip
+                h_len = len(headers)
+                dict_rows = [
+                    dict(zip(headers, r if len(r) >= h_len else r + [""] * (h_len - len(r))))
+                    for r in rows
+                ]
+                st.table(dict_rows)
+            else:
+                st.table(rows)
+
+            # Compact, scrollable JSON with Copy button
+            json_text = json.dumps(t, indent=2, ensure_ascii=False)
+            copybox("Table JSON", json_text, height=140, key=f"json_{idx}")
+    else:
+        st.info("No tables parsed yet.")
 
-st.text_area(
-    "Paste GPT response containing Markdown headings and tables",
-    key="gpt_input",
-    height=260,
-    placeholder="# Title\n\n| Col A | Col B |\n|---|---|\n| foo | bar |",
-)
 
-t1, t2 = st.columns([1, 1])
-with t1:
-    st.button("Parse tables", use_container_width=True, on_click=handle_parse_tables)
-with t2:
-    st.button("Clear tables", use_container_width=True, on_click=handle_clear_tables)
-
-tables = st.session_state.tables_output
-if tables:
-    for idx, t in enumerate(tables, start=1):
-        title = t.get("title") or "(untitled)"
-        st.subheader(f"Table {idx}: {title}")
-
-        headers = t.get("headers") or []
-        rows = t.get("rows") or []
-
-        if headers:
-            # Render as list-of-dicts for nice headers
-            dict_rows = []
-            for r in rows:
-                d = {}
-                for i, h in enumerate(headers):
-                    d[h] = r[i] if i < len(r) else ""
-                dict_rows.append(d)
-            st.table(dict_rows)
-        else:
-            st.table(rows)
-
-        # Compact, scrollable JSON with Copy button
-        json_text = json.dumps(t, indent=2)
-        copybox("Table JSON", json_text, height=140, key=f"json_{idx}")
-else:
-    st.info("No tables parsed yet.")
+tables_section()
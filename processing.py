@@ -0,0 +1,220 @@
+import functools
+import re
+from typing import List, Dict, Any
+
+from markdown_it import MarkdownIt
+
+
+# ---------------------------
+# Processing logic
+# ---------------------------
+
+# First "Abstract" (accept line 'Abstract' or word followed by newline)
+_ABSTRACT_STRICT = re.compile(r'(?im)^[ \t]*abstract[ \t]*\r?\n')
+_ABSTRACT_LOOSE = re.compile(r'(?i)\babstract\b[ \t]*\r?\n')
+
+# "References" block
+_REFERENCES = re.compile(
+    r'(?ims)'                              # case-insensitive, multiline, dot matches newlines
+    r'^\s*references\s*\r?\n'              # line with 'References'
+    r'\s*this\s+article\s+references\s+'   # 'This article references'
+    r'(\d+)\s+other\s+publications\.\s*'   # '<NUMBER> other publications.'
+)
+
+# Anchored checks run at each "abstract"/"references" hit found by str.find
+_ABSTRACT_TAIL = re.compile(r'[ \t]*\r?\n')
+_REFERENCES_TAIL = re.compile(
+    r'(?i)\s*\r?\n'
+    r'\s*this\s+article\s+references\s+(\d+)\s+other\s+publications\.'
+)
+
+_LEADING_BLANK = re.compile(r'^[ \t]*\r?\n')
+
+
+def _find_abstract_end(text: str, lower: str) -> int | None:
+    """
+    Same result as `_ABSTRACT_STRICT.search(text) or _ABSTRACT_LOOSE.search(text)`,
+    using substring scans over the lowercased text. Only valid when `lower` is
+    index-aligned with `text` and contains no 'ſ' (see condense_text).
+    """
+    loose_end = None
+    pos = lower.find('abstract')
+    while pos != -1:
+        # Strict: only spaces/tabs between the line start and the word.
+        # Walk back over them rather than rfind the newline, which would rescan
+        # the whole line for every hit on a long single-line paste.
+        i = pos
+        while i > 0 and text[i - 1] in ' \t':
+            i -= 1
+        strict = i == 0 or text[i - 1] == '\n'
+        if strict or loose_end is None:
+            prev = text[pos - 1] if pos else ''
+            if strict or not (prev.isalnum() or prev == '_'):
+                m = _ABSTRACT_TAIL.match(text, pos + 8)
+                if m:
+                    if strict:
+                        return m.end()
+                    loose_end = m.end()
+        pos = lower.find('abstract', pos + 8)
+    return loose_end
+
+
+def _find_references_start(text: str, lower: str) -> int | None:
+    """
+    Same result as `_REFERENCES.search(text).start()`, using substring scans.
+    Same preconditions as `_find_abstract_end`.
+    """
+    pos = lower.find('references')
+    while pos != -1:
+        # The heading must be alone on its line; the block starts at the
+        # earliest line start in the whitespace run before it (blank lines
+        # above it are included)
+        ws_start = pos
+        while ws_start > 0 and text[ws_start - 1].isspace():
+            ws_start -= 1
+        if ws_start == 0:
+            start = 0
+        else:
+            start = text.find('\n', ws_start, pos) + 1
+        if (ws_start == 0 or start) and _REFERENCES_TAIL.match(text, pos + 10):
+            return start
+        pos = lower.find('references', pos + 10)
+    return None
+
+
+@functools.lru_cache(maxsize=16)
+def condense_text(article_text: str) -> str:
+    """
+    Your requested logic:
+
+    - Find the first occurrence of an 'Abstract' heading/line and return the text AFTER it.
+    - Find the 'References' block:
+
+        References
+        This article references <NUMBER> other publications.
+
+      Return the text BEFORE this block.
+    - If BOTH are found and Abstract precedes References, return the intersection:
+        [after Abstract .. before References]
+      Else return whichever slice is found; if neither is found, return the original text.
+    """
+    text = article_text
+
+    lower = text.lower()
+    if len(lower) == len(text) and 'ſ' not in lower:
+        abstract_after_idx = _find_abstract_end(text, lower)
+        references_start_idx = _find_references_start(text, lower)
+    else:
+        # A few characters (e.g. 'İ') lowercase to several code points, which
+        # would misalign indices between `lower` and `text`; and re.IGNORECASE
+        # matches 'ſ' (long s) as 's' while str.lower() leaves it alone. Scan
+        # with regex instead.
+        abstract_match = _ABSTRACT_STRICT.search(text) or _ABSTRACT_LOOSE.search(text)
+        abstract_after_idx = abstract_match.end() if abstract_match else None
+
+        references_match = _REFERENCES.search(text)
+        references_start_idx = references_match.start() if references_match else None
+
+    if abstract_after_idx is not None and references_start_idx is not None:
+        if abstract_after_idx < references_start_idx:
+            result = text[abstract_after_idx:references_start_idx]
+        else:
+            # If order is inverted, prefer "after Abstract"
+            result = text[abstract_after_idx:]
+    elif abstract_after_idx is not None:
+        result = text[abstract_after_idx:]
+    elif references_start_idx is not None:
+        result = text[:references_start_idx]
+    else:
+        result = text
+
+    # Tidy leading/trailing whitespace
+    result = _LEADING_BLANK.sub('', result)
+    result = result.strip('\n\r ')
+    return result
+
+
+# Only block structure and the raw `inline.content` strings are read from the
+# tokens, so skip the inline pass (emphasis, links, code spans, ... child tokens).
+# parse() keeps no per-call state on the instance, so it is safe to share.
+_MD = MarkdownIt("commonmark").enable("table").disable("inline")
+
+# parse_markdown_tables scan states
+_OUTER, _IN_THEAD, _IN_TBODY = range(3)
+
+# Token types (besides `inline`) that change the scan state
+_TABLE_EVENTS = frozenset(
+    ("table_open", "thead_open", "thead_close", "tr_open", "tr_close", "table_close")
+)
+
+
+def parse_markdown_tables(md_text: str) -> List[Dict[str, Any]]:
+    """
+    Parse all markdown tables and associate each with the nearest preceding heading (H1..H6).
+
+    Returns a list of table dicts:
+      {
+        "title": "<heading text or ''>",
+        "headers": ["Col1", "Col2", ...],
+        "rows": [["r1c1","r1c2",...], ["r2c1","r2c2",...]]
+      }
+    """
+    # Every GFM table has a '|' in its header row; skip tokenizing plain prose
+    if '|' not in md_text:
+        return []
+
+    tokens = _MD.parse(md_text)
+
+    results: List[Dict[str, Any]] = []
+    last_heading_text: str = ""
+
+    state = _OUTER
+    headers: list[str] = []
+    rows: list[list[str]] = []
+    cur_row: list[str] = []
+    prev_type = ""
+
+    # Single forward pass; an `inline` token is classified by the token before it
+    for tok in tokens:
+        ttype = tok.type
+
+        # markdown-it's heading, lheading and table rules already strip the
+        # `inline.content` they emit, so it is used as-is
+        if ttype == "inline":
+            # Track nearest preceding heading
+            if prev_type == "heading_open":
+                last_heading_text = tok.content
+            elif prev_type in ("th_open", "td_open"):
+                cur_row.append(tok.content)
+
+        elif ttype not in _TABLE_EVENTS:
+            # td/th open+close, tbody, paragraphs, ...: nothing to do
+            pass
+
+        elif state == _OUTER:
+            if ttype == "table_open":
+                state = _IN_TBODY
+                headers, rows, cur_row = [], [], []
+
+        # Extract table
+        elif ttype == "thead_open":
+            state = _IN_THEAD
+        elif ttype == "thead_close":
+            state = _IN_TBODY
+
+        elif ttype == "tr_open":
+            cur_row = []
+        elif ttype == "tr_close":
+            if state == _IN_THEAD:
+                headers = cur_row
+            else:
+                rows.append(cur_row)
+            cur_row = []
+
+        elif ttype == "table_close":
+            results.append({"title": last_heading_text, "headers": headers, "rows": rows})
+            state = _OUTER
+
+        prev_type = ttype
+
+    return results
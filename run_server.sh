@@ -1 +1 @@
-streamlit run app.py --server.port 8000 --server.address 0.0.0.0
\ No newline at end of file
+streamlit run app.py --server.port 8000 --server.address 0.0.0.0 --server.enableWebsocketCompression true
\ No newline at end of file
@@ -0,0 +1,162 @@
+import random
+import re
+
+import pytest
+
+import processing
+from processing import (
+    _find_abstract_end,
+    _find_references_start,
+    condense_text,
+    parse_markdown_tables,
+)
+
+# Reference rules: the regexes condense_text originally searched with.
+# _find_abstract_end/_find_references_start reimplement them with str.find
+# and must agree with them exactly.
+ABSTRACT_STRICT = re.compile(r'(?im)^[ \t]*abstract[ \t]*\r?\n')
+ABSTRACT_LOOSE = re.compile(r'(?i)\babstract\b[ \t]*\r?\n')
+REFERENCES = re.compile(
+    r'(?ims)^\s*references\s*\r?\n'
+    r'\s*this\s+article\s+references\s+(\d+)\s+other\s+publications\.\s*'
+)
+
+PIECES = [
+    "\nAbstract\n", "  ABSTRACT \r\n", " the abstract\n", "_abstract\n", "1abstract\n",
+    "δabstract\n", "abstracts\n", "\nabstract x\n", "\t Abstract\n",
+    "\nReferences\nThis article references 45 other publications.\n",
+    "\n  references  \n\n this  article references 3 other publications.",
+    "foo\n\t\nReferences\n", "x References\nThis article references 2 other publications.",
+    "\n\n\nreferences \r\n\r\n  This article references 7 other publications.",
+    "REFERENCES\nthis article references 12 other publications.",
+    "references\nThis article references 1 other\npublications.",
+    "References\n\x85this article references 3 other publications.",
+    "References\nThis article references ٣ other publications.",
+    "\nReferences\nThis article references many other publications.\n",
+    "Abſtract\n", "\nReferenceſ\nThis article references 5 other publications.\n",
+]
+FILLER = ["NMR", "δ", "¹H", "data", "the", "of", "\n", "\t", " ", "\xa0"]
+
+
+def _reference(text):
+    m = ABSTRACT_STRICT.search(text) or ABSTRACT_LOOSE.search(text)
+    r = REFERENCES.search(text)
+    return (m.end() if m else None), (r.start() if r else None)
+
+
+def _corpus(n=5000):
+    rng = random.Random(0)
+    for _ in range(n):
+        yield "".join(
+            rng.choice(PIECES) if rng.random() < 0.3 else rng.choice(FILLER) + rng.choice(" \n")
+            for _ in range(rng.randint(0, 30))
+        )
+
+
+def test_anchor_scans_match_regex_rules():
+    for text in _corpus():
+        lower = text.lower()
+        if 'ſ' in lower:
+            continue  # condense_text routes these to the regex scan
+        found = (_find_abstract_end(text, lower), _find_references_start(text, lower))
+        assert found == _reference(text), text
+
+
+def test_condense_text_matches_regex_rules():
+    for text in _corpus():
+        abstract_end, references_start = _reference(text)
+        if abstract_end is not None and references_start is not None:
+            if abstract_end < references_start:
+                expected = text[abstract_end:references_start]
+            else:
+                expected = text[abstract_end:]
+        elif abstract_end is not None:
+            expected = text[abstract_end:]
+        elif references_start is not None:
+            expected = text[:references_start]
+        else:
+            expected = text
+        expected = re.sub(r'^[ \t]*\r?\n', '', expected).strip('\n\r ')
+        assert condense_text(text) == expected, text
+
+
+def test_condense_text_treats_long_s_like_regex():
+    # re.IGNORECASE matches 'ſ' as 's'; str.lower() does not
+    text = "Abſtract\nABSTRACT  \r\nreferences\nx abstract\n"
+    assert condense_text(text) == "ABSTRACT  \r\nreferences\nx abstract"
+
+
+def test_condense_text_slices_between_abstract_and_references():
+    text = (
+        "Title\nAbstract\nBody text\n"
+        "References\nThis article references 4 other publications.\nRef 1\n"
+    )
+    assert condense_text(text) == "Body text"
+
+
+def test_condense_text_falls_back_to_regex_when_lowercase_changes_length():
+    # 'İ'.lower() is two code points, so the str.find indices would misalign
+    text = "İ\nAbstract\nBody\n\nReferences\nThis article references 2 other publications."
+    assert condense_text(text) == "Body"
+
+
+def test_condense_text_returns_text_without_anchors():
+    assert condense_text("just some text\n") == "just some text"
+
+
+@pytest.mark.parametrize("md_text, expected", [
+    # ATX heading as title
+    (
+        "# Compound 1\n\n| Position | δ (ppm) |\n|---|---|\n| 1 | 7.2 |\n",
+        [{"title": "Compound 1", "headers": ["Position", "δ (ppm)"], "rows": [["1", "7.2"]]}],
+    ),
+    # Setext heading as title
+    (
+        "Compound 2a\n===========\n\n| A | B |\n|---|---|\n| x | y |\n",
+        [{"title": "Compound 2a", "headers": ["A", "B"], "rows": [["x", "y"]]}],
+    ),
+    # Short rows are padded by markdown-it, long rows truncated to the header
+    (
+        "## T\n\n| A | B | C |\n|---|---|---|\n| 1 |\n| 1 | 2 | 3 | 4 |\n",
+        [{"title": "T", "headers": ["A", "B", "C"], "rows": [["1", "", ""], ["1", "2", "3"]]}],
+    ),
+    # Escaped pipe stays inside the cell; inline markup is kept raw
+    (
+        "| A | B |\n|---|---|\n| a \\| b | `x` |\n",
+        [{"title": "", "headers": ["A", "B"], "rows": [["a | b", "`x`"]]}],
+    ),
+    # Table inside a blockquote
+    (
+        "# Q\n\n> | q | r |\n> |---|---|\n> | 1 | 2 |\n",
+        [{"title": "Q", "headers": ["q", "r"], "rows": [["1", "2"]]}],
+    ),
+    # Table inside a list item
+    (
+        "# L\n\n- item\n\n  | x | y |\n  |---|---|\n  | 1 | 2 |\n",
+        [{"title": "L", "headers": ["x", "y"], "rows": [["1", "2"]]}],
+    ),
+    # Table-like text in a fenced code block is not a table; the one after it is
+    (
+        "# F\n\n```\n| a | b |\n|---|---|\n| 1 | 2 |\n```\n\n| c | d |\n|---|---|\n| 3 | 4 |\n",
+        [{"title": "F", "headers": ["c", "d"], "rows": [["3", "4"]]}],
+    ),
+    # Each table takes the nearest preceding heading
+    (
+        "# One\n\n| A |\n|---|\n| 1 |\n\n# Two\n\ntext\n\n| B |\n|---|\n| 2 |\n",
+        [
+            {"title": "One", "headers": ["A"], "rows": [["1"]]},
+            {"title": "Two", "headers": ["B"], "rows": [["2"]]},
+        ],
+    ),
+])
+def test_parse_markdown_tables(md_text, expected):
+    assert parse_markdown_tables(md_text) == expected
+
+
+def test_parse_markdown_tables_skips_parsing_without_pipes(monkeypatch):
+    class NoParse:
+        def parse(self, md_text):
+            raise AssertionError("tokenized input without '|'")
+
+    monkeypatch.setattr(processing, "_MD", NoParse())
+    assert parse_markdown_tables("# Just prose\n\nNo tables here.\n") == []